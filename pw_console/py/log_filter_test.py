@@ -127,6 +127,22 @@ class TestLogFilter(unittest.TestCase):
             None,  # field
             False,  # invert
         ),
+        (
+            'string with regex characters',
+            SearchMatcher.STRING,
+            'f(x)',
+            [
+                ('Call f(x) now', dict()),
+                ('Calling F(X) instead', dict()),
+                ('Call fx now', dict()),
+            ],
+            [
+                'Call f(x) now',
+                'Calling F(X) instead',
+            ],
+            None,  # field
+            False,  # invert
+        ),
         (
             'simple fuzzy inverted',
             SearchMatcher.FUZZY,
@@ -193,11 +209,18 @@ class TestLogFilter(unittest.TestCase):
         """Test log filter matches expected lines."""
         result_text, re_flag = preprocess_search_regex(input_text,
                                                        input_matcher)
+        # String matches use a plain substring needle; see
+        # LogView.set_search_regex().
+        literal_text = None
+        if input_matcher == SearchMatcher.STRING:
+            literal_text = (input_text.lower()
+                            if re_flag & re.IGNORECASE else input_text)
         log_filter = LogFilter(
             regex=re.compile(result_text, re_flag),
             input_text=input_text,
             invert=invert,
             field=field,
+            literal=literal_text,
         )
 
         matched_lines = []
@@ -210,6 +233,54 @@ class TestLogFilter(unittest.TestCase):
 
         self.assertEqual(expected_matched_lines, matched_lines)
 
+    def test_highlight_search_matches(self) -> None:
+        """Test highlighting matched spans in formatted text fragments."""
+        line_fragments = [
+            ('class:one', 'Log some '),
+            ('class:two', 'item here'),
+        ]
+
+        # Match fully inside the second fragment.
+        log_filter = LogFilter(regex=re.compile('item'))
+        self.assertEqual(
+            log_filter.highlight_search_matches(line_fragments),
+            [
+                ('class:one', 'Log some '),
+                ('class:two class:search ', 'item'),
+                ('class:two', ' here'),
+            ],
+        )
+
+        # Match spanning both fragments with the selected line style.
+        log_filter = LogFilter(regex=re.compile('some item'))
+        self.assertEqual(
+            log_filter.highlight_search_matches(line_fragments,
+                                                selected=True),
+            [
+                ('class:one', 'Log '),
+                ('class:one class:search.current ', 'some '),
+                ('class:two class:search.current ', 'item'),
+                ('class:two', ' here'),
+            ],
+        )
+
+        # No match; fragments are returned unmodified.
+        log_filter = LogFilter(regex=re.compile('no match'))
+        self.assertEqual(
+            log_filter.highlight_search_matches(line_fragments),
+            line_fragments,
+        )
+
+        # Inverted filters highlight the whole line.
+        log_filter = LogFilter(regex=re.compile('item'), invert=True)
+        self.assertEqual(
+            log_filter.highlight_search_matches(line_fragments),
+            [
+                ('class:one class:search ', 'Log some '),
+                ('class:two class:search ', 'item here'),
+            ],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -28,6 +28,7 @@ from pw_console.log_screen import ScreenLine
 from pw_console.text_formatting import (
     flatten_formatted_text_tuples,
     join_adjacent_style_tuples,
+    remove_formatting,
 )
 
 _PYTHON_3_8 = sys.version_info >= (
@@ -365,6 +366,108 @@ class TestLogView(unittest.TestCase):
         # Log index should be None
         self.assertEqual(result.log_index, None)
 
+    def _create_log_view_from_messages(self, messages):
+        log_view, log_pane = _create_log_view()
+
+        test_log = logging.getLogger('log_view.test')
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            for message in messages:
+                test_log.debug('%s', message)
+
+        return log_view, log_pane
+
+    def test_string_search_forwards_backwards_and_wrap(self) -> None:
+        """Test string searches that scan the joined log buffer."""
+        # pylint: disable=protected-access
+        log_view, _pane = self._create_log_view_from_messages([
+            'apple one',
+            'banana two',
+            'apple three',
+            'cherry four',
+            'apple five',
+        ])
+        log_view.render_content()
+
+        self.assertTrue(
+            log_view.new_search('apple',
+                                search_matcher='STRING',
+                                interactive=False))
+        # String searches with no filtering should use the joined buffer.
+        self.assertTrue(log_view._search_buffer_usable())
+
+        # Follow mode starts at the last log; searching forwards should
+        # wrap around to the first match.
+        self.assertEqual(log_view.log_index, 4)
+        log_view.search_forwards()
+        self.assertEqual(log_view.log_index, 0)
+        log_view.search_forwards()
+        self.assertEqual(log_view.log_index, 2)
+        log_view.search_forwards()
+        self.assertEqual(log_view.log_index, 4)
+
+        # Searching backwards from the first match should wrap around to
+        # the last one.
+        log_view.search_backwards()
+        self.assertEqual(log_view.log_index, 2)
+        log_view.search_backwards()
+        self.assertEqual(log_view.log_index, 0)
+        log_view.search_backwards()
+        self.assertEqual(log_view.log_index, 4)
+
+        # Search with no matches anywhere; the position should not move.
+        self.assertTrue(
+            log_view.new_search('zebra',
+                                search_matcher='STRING',
+                                interactive=False))
+        log_view.search_forwards()
+        self.assertEqual(log_view.log_index, 4)
+        log_view.search_backwards()
+        self.assertEqual(log_view.log_index, 4)
+
+    def test_regex_search_with_lookaround_uses_per_line_scan(self) -> None:
+        """Test lookaround regexes fall back to per-line matching.
+
+        A lookbehind referencing a line boundary never matches in the
+        joined log buffer even though it matches per-line; regex searches
+        must not use the joined buffer fast path."""
+        # pylint: disable=protected-access
+        log_view, _pane = self._create_log_view_from_messages([
+            'aaa',
+            'Qfoo',
+            'ccc',
+        ])
+        log_view.render_content()
+
+        self.assertTrue(
+            log_view.new_search(r'(?<!\n)Qfoo',
+                                search_matcher='REGEX',
+                                interactive=False))
+        self.assertFalse(log_view._search_buffer_usable())
+        log_view.search_forwards()
+        self.assertEqual(log_view.log_index, 1)
+
+    def test_fragment_cache_not_reused_when_log_indexes_shift(self) -> None:
+        """Test cached line fragments are dropped if log indexes shift.
+
+        Log indexes shift whenever old logs are trimmed from the front of the
+        store deque or filtered logs are backfilled. The same index must not
+        return another log's cached fragments."""
+        # pylint: disable=protected-access
+        log_view, _pane = self._create_log_view_with_logs(log_count=10)
+        log_view.render_content()
+
+        fragments_per_line = log_view.log_screen._get_fragments_per_line(3)
+        self.assertIn('Test log 3',
+                      remove_formatting(fragments_per_line[0]))
+
+        # Drop the oldest log; every log_index now refers to the next log.
+        log_view.log_store.logs.popleft()
+
+        fragments_per_line = log_view.log_screen._get_fragments_per_line(3)
+        self.assertIn('Test log 4',
+                      remove_formatting(fragments_per_line[0]))
+
     def test_visual_select(self) -> None:
         """Test log line selection."""
         log_view, log_pane = self._create_log_view_with_logs(log_count=100)
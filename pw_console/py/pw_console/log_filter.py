@@ -16,20 +16,36 @@
 from __future__ import annotations
 import logging
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
 from prompt_toolkit.formatted_text import StyleAndTextTuples
 from prompt_toolkit.formatted_text.utils import fragment_list_to_text
-from prompt_toolkit.layout.utils import explode_text_fragments
 from prompt_toolkit.validation import ValidationError, Validator
 
 from pw_console.log_line import LogLine
 
 _LOG = logging.getLogger(__package__)
 
-_UPPERCASE_REGEX = re.compile(r'[A-Z]')
+# Caches of base style -> interned highlighted style, one per highlight
+# class so lookups don't branch on the suffix. Log lines reuse a small set
+# of base styles; interning collapses the repeated string concatenations in
+# highlight_search_matches() into one allocation per distinct base style.
+_SEARCH_STYLE_CACHE: dict = {}
+_SEARCH_CURRENT_STYLE_CACHE: dict = {}
+
+
+def _highlighted_style(base_style: str, selected: bool) -> str:
+    """Return the interned highlight style string for base_style."""
+    cache = (_SEARCH_CURRENT_STYLE_CACHE if selected else _SEARCH_STYLE_CACHE)
+    new_style = cache.get(base_style)
+    if new_style is None:
+        suffix = ' class:search.current ' if selected else ' class:search '
+        new_style = sys.intern(base_style + suffix)
+        cache[base_style] = new_style
+    return new_style
 
 
 class SearchMatcher(Enum):
@@ -46,7 +62,7 @@ def preprocess_search_regex(text,
                             matcher: SearchMatcher = DEFAULT_SEARCH_MATCHER):
     # Ignorecase unless the text has capital letters in it.
     regex_flags = re.IGNORECASE
-    if _UPPERCASE_REGEX.search(text):
+    if text != text.lower():
         regex_flags = re.RegexFlag(0)
 
     if matcher == SearchMatcher.FUZZY:
@@ -84,6 +100,15 @@ class LogFilter:
     input_text: Optional[str] = None
     invert: bool = False
     field: Optional[str] = None
+    # Plain substring needle for literal (non-regex) searches. If set,
+    # matches() uses Python's C-level substring scan which is several times
+    # faster than dispatching to the regex engine for each log line. CPython
+    # implements str.__contains__ with the two-way / Boyer-Moore-Horspool
+    # style FASTSEARCH algorithm, so this stays fast for long needles too;
+    # no native extension is needed. The compiled regex is still used for
+    # highlighting match spans. The needle is stored pre-lowercased if the
+    # regex was compiled with re.IGNORECASE.
+    literal: Optional[str] = None
 
     def pattern(self):
         return self.regex.pattern
@@ -102,7 +127,17 @@ class LogFilter:
             elif self.field == 'time':
                 field = log.record.asctime
 
-        match = self.regex.search(field)
+        if self.literal is not None:
+            if self.regex.flags & re.IGNORECASE:
+                # Use the cached lowercased log when searching the whole
+                # line; metadata fields still need lowering per call.
+                if field is log.ansi_stripped_log:
+                    field = log.ansi_stripped_log_lower
+                else:
+                    field = field.lower()
+            match = self.literal in field
+        else:
+            match = self.regex.search(field)
 
         if self.invert:
             return not match
@@ -112,31 +147,63 @@ class LogFilter:
                                  line_fragments,
                                  selected=False) -> StyleAndTextTuples:
         """Highlight search matches in the current line_fragment."""
-        line_text = fragment_list_to_text(line_fragments)
-        exploded_fragments = explode_text_fragments(line_fragments)
-
-        def apply_highlighting(fragments, i):
-            # Expand all fragments and apply the highlighting style.
-            old_style, _text, *_ = fragments[i]
-            if selected:
-                fragments[i] = (
-                    old_style + ' class:search.current ',
-                    fragments[i][1],
-                )
-            else:
-                fragments[i] = (
-                    old_style + ' class:search ',
-                    fragments[i][1],
-                )
-
         if self.invert:
-            # Highlight the whole line
-            for i, _fragment in enumerate(exploded_fragments):
-                apply_highlighting(exploded_fragments, i)
-        else:
-            # Highlight each non-overlapping search match.
-            for match in self.regex.finditer(line_text):
-                for fragment_i in range(match.start(), match.end()):
-                    apply_highlighting(exploded_fragments, fragment_i)
-
-        return exploded_fragments
+            # Highlight the whole line; restyle each fragment as-is.
+            return [(_highlighted_style(fragment[0], selected), fragment[1])
+                    for fragment in line_fragments]
+
+        # Highlight each non-overlapping search match. Matches are collected
+        # up front so lines without any match skip the fragment rebuild
+        # entirely. This can happen when the match is in a metadata field
+        # that isn't rendered or hidden by the table view.
+        line_text = fragment_list_to_text(line_fragments)
+        matches = [(match.start(), match.end())
+                   for match in self.regex.finditer(line_text)]
+        if not matches:
+            return line_fragments
+
+        # Sweep the fragments and matches in one linear pass. A fragment
+        # overlapping a match is split into unchanged and highlighted pieces
+        # rather than exploding the whole line into one fragment per
+        # character.
+        new_fragments: StyleAndTextTuples = []
+        match_index = 0
+        match_start, match_end = matches[0]
+        position = 0
+        for fragment in line_fragments:
+            style = fragment[0]
+            text = fragment[1]
+            # Zero width fragments don't contribute to line_text positions;
+            # pass them through unchanged.
+            if '[ZeroWidthEscape]' in style:
+                new_fragments.append(fragment)
+                continue
+
+            fragment_end = position + len(text)
+            # Offset into text of the first character not yet re-emitted.
+            offset = 0
+            while match_index < len(matches) and match_start < fragment_end:
+                overlap_start = max(match_start, position)
+                overlap_end = min(match_end, fragment_end)
+                if overlap_start - position > offset:
+                    # Unhighlighted piece before this match.
+                    new_fragments.append(
+                        (style, text[offset:overlap_start - position]))
+                if overlap_end > overlap_start:
+                    new_fragments.append(
+                        (_highlighted_style(style, selected),
+                         text[overlap_start - position:overlap_end -
+                              position]))
+                offset = overlap_end - position
+                if match_end > fragment_end:
+                    # This match continues into the next fragment.
+                    break
+                match_index += 1
+                if match_index < len(matches):
+                    match_start, match_end = matches[match_index]
+            if offset < len(text):
+                # Unhighlighted remainder of this fragment.
+                new_fragments.append((style, text[offset:]))
+            position = fragment_end
+
+        return new_fragments
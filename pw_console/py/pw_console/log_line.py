@@ -33,6 +33,20 @@ class LogLine:
     def __post_init__(self):
         self.metadata = None
         self.fragment_cache = None
+        # Cached (table formatting tag, fragments) tuple set by
+        # TableView.formatted_row().
+        self.table_row_cache = None
+        self._ansi_stripped_log_lower = None
+
+    @property
+    def ansi_stripped_log_lower(self) -> str:
+        """Lowercased ansi_stripped_log for case-insensitive searching.
+
+        Computed once on first use so repeated searches and highlights don't
+        re-casefold the same line."""
+        if self._ansi_stripped_log_lower is None:
+            self._ansi_stripped_log_lower = self.ansi_stripped_log.lower()
+        return self._ansi_stripped_log_lower
 
     def time(self):
         """Return a datetime object for the log record."""
@@ -38,6 +38,11 @@ if TYPE_CHECKING:
 _LOG = logging.getLogger(__package__)
 
 
+def _fragment_line_width(line_fragments: StyleAndTextTuples) -> int:
+    """Character count of a line's fragments minus the ending line break."""
+    return sum(len(fragment[1]) for fragment in line_fragments) - 1
+
+
 @dataclasses.dataclass
 class ScreenLine:
     """A single line of text for displaying on screen.
@@ -114,11 +119,21 @@ class ScreenLine:
     # instance.
     height: int = 1
 
+    # Display width of this line's text. Computed once when the line is
+    # created so consumers don't have to re-walk the fragment list or assume
+    # one fragment per character.
+    width: int = 0
+
     # Empty lines will have no log_index
     def empty(self) -> bool:
         return self.log_index is None
 
 
+# Shared instance used to pad empty screen space; see
+# LogScreen._fill_top_with_empty_lines().
+_EMPTY_SCREEN_LINE = ScreenLine([('', '')])
+
+
 @dataclasses.dataclass
 class LogScreen:
     """LogScreen maintains the state of visible logs on screen.
@@ -152,11 +167,21 @@ class LogScreen:
         # Save the last log index when appending. Useful for tracking how many
         # new lines need appending in follow mode.
         self.last_appended_log_index: int = 0
+        # The most recent _get_fragments_per_line() result and the settings
+        # it was computed with. Scrolling through a wrapped log message
+        # fetches one subline at a time; this avoids re-formatting and
+        # re-wrapping the same log once per subline.
+        self._fragments_per_line_cache_key: Optional[tuple] = None
+        self._fragments_per_line_cache: List[StyleAndTextTuples] = []
 
     def _fill_top_with_empty_lines(self) -> None:
         """Add empty lines to fill the remaining empty screen space."""
-        for _ in range(self.height - len(self.line_buffer)):
-            self.line_buffer.appendleft(ScreenLine([('', '')]))
+        missing_lines = self.height - len(self.line_buffer)
+        if missing_lines > 0:
+            # ScreenLines are never mutated once created, so the same empty
+            # instance can pad every slot rather than allocating one
+            # ScreenLine (and its fragment list) per line per screen reset.
+            self.line_buffer.extendleft([_EMPTY_SCREEN_LINE] * missing_lines)
 
     def clear_screen(self) -> None:
         """Erase all lines and fill with empty lines."""
@@ -219,43 +244,48 @@ class LogScreen:
         if not marked_logs_end:
             marked_logs_end = -1
 
-        all_lines: List[StyleAndTextTuples] = []
-        # Loop through a copy of the line_buffer in case it is mutated before
-        # this function is complete.
-        for i, line in enumerate(list(self.line_buffer)):
-
-            # Is this line the cursor_position? Apply line highlighting
-            if (i == self.cursor_position
-                    and (self.cursor_position < len(self.line_buffer))
-                    and not self.line_buffer[self.cursor_position].empty()):
-                # Fill in empty charaters to the width of the screen. This
-                # ensures the backgound is highlighted to the edge of the
-                # screen.
-                new_fragments = fill_character_width(
-                    line.fragments,
-                    len(line.fragments) - 1,  # -1 for the ending line break
-                    self.width,
-                )
-
-                # Apply a style to highlight this line.
-                all_lines.append(
-                    to_formatted_text(new_fragments,
-                                      style='class:selected-log-line'))
-            elif line.log_index is not None and (
-                    marked_logs_start <= line.log_index <= marked_logs_end):
-                new_fragments = fill_character_width(
-                    line.fragments,
-                    len(line.fragments) - 1,  # -1 for the ending line break
-                    self.width,
-                )
-
-                # Apply a style to highlight this line.
-                all_lines.append(
-                    to_formatted_text(new_fragments,
-                                      style='class:marked-log-line'))
-
-            else:
-                all_lines.append(line.fragments)
+        # Take a copy of the line_buffer in case it is mutated before this
+        # function is complete.
+        line_buffer = list(self.line_buffer)
+        # Start with each line's fragments unmodified; the cursor and marked
+        # lines below are restyled by direct index rather than checking
+        # every line.
+        all_lines: List[StyleAndTextTuples] = [
+            line.fragments for line in line_buffer
+        ]
+
+        cursor_position = self.cursor_position
+        highlight_cursor_line = (0 <= cursor_position < len(line_buffer)
+                                 and not line_buffer[cursor_position].empty())
+
+        # Apply a style to highlight any marked lines.
+        if marked_logs_start >= 0:
+            for i, line in enumerate(line_buffer):
+                # The cursor line is restyled below.
+                if i == cursor_position and highlight_cursor_line:
+                    continue
+                if line.log_index is not None and (marked_logs_start <=
+                                                   line.log_index <=
+                                                   marked_logs_end):
+                    new_fragments = fill_character_width(
+                        line.fragments,
+                        line.width,
+                        self.width,
+                    )
+                    all_lines[i] = to_formatted_text(
+                        new_fragments, style='class:marked-log-line')
+
+        # Apply a style to highlight the line under the cursor. Fill in
+        # empty charaters to the width of the screen. This ensures the
+        # backgound is highlighted to the edge of the screen.
+        if highlight_cursor_line:
+            new_fragments = fill_character_width(
+                line_buffer[cursor_position].fragments,
+                line_buffer[cursor_position].width,
+                self.width,
+            )
+            all_lines[cursor_position] = to_formatted_text(
+                new_fragments, style='class:selected-log-line')
 
         return all_lines
 
@@ -560,6 +590,15 @@ class LogScreen:
         search_filter = self.get_search_filter()
         search_highlight = self.get_search_highlight()
 
+        # Return the cached lines if the log and all formatting settings are
+        # unchanged since the last call. The key must contain the log itself
+        # rather than its index; indexes shift whenever logs are trimmed from
+        # the front of the source deque or backfilled by filtering.
+        cache_key = (log, self.width, truncate_lines, table_formatter,
+                     search_filter, search_highlight)
+        if cache_key == self._fragments_per_line_cache_key:
+            return self._fragments_per_line_cache
+
         # Select the log display formatter; table or standard.
         fragments: StyleAndTextTuples = []
         if table_formatter:
@@ -579,6 +618,8 @@ class LogScreen:
         # Convert the existing flattened fragments to a list of lines.
         fragments_per_line = split_lines(line_fragments)
 
+        self._fragments_per_line_cache_key = cache_key
+        self._fragments_per_line_cache = fragments_per_line
         return fragments_per_line
 
     def prepend_log(
@@ -620,6 +661,7 @@ class LogScreen:
                     log_index=log_index,
                     subline=line_index,
                     height=len(fragments_per_line),
+                    width=_fragment_line_width(line),
                 ))
 
         # Remove lines from the bottom if over the screen height.
@@ -647,6 +689,7 @@ class LogScreen:
                     log_index=log_index,
                     subline=line_index,
                     height=len(fragments_per_line),
+                    width=_fragment_line_width(line),
                 ))
 
         # Remove lines from the top if over the screen height.
@@ -14,11 +14,12 @@
 """LogStore saves logs and acts as a Python logging handler."""
 
 from __future__ import annotations
+import array
 import collections
 import logging
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import pw_cli.color
 
@@ -150,6 +151,10 @@ class LogStore(logging.Handler):
         self.channel_counts = {}
         self.channel_formatted_prefix_widths = {}
         self.line_index = 0
+        # Joined log text for batch searching; see get_search_buffer().
+        self._search_buffer: str = ''
+        self._search_buffer_offsets: array.array = array.array('q')
+        self._search_buffer_valid: bool = False
 
     def get_channel_counts(self):
         """Return the seen channel log counts for this conatiner."""
@@ -167,6 +172,38 @@ class LogStore(logging.Handler):
         total = self.get_total_count()
         return 0 if total < 0 else total - 1
 
+    def get_search_buffer(self) -> Tuple[str, array.array]:
+        """Return all logs joined into one string plus per-log offsets.
+
+        The buffer contains each log's ansi_stripped_log separated by
+        newlines. Scanning this single string with one C-level regex or
+        substring search is far faster than looping over each log line in
+        Python. Bisecting the returned offsets maps a match position back
+        to the owning log's index. Offsets are stored in a packed int64
+        array.array rather than a list of Python int objects; at the max
+        history size of one million logs this saves tens of megabytes and
+        keeps the bisect working set contiguous. The buffer is rebuilt
+        lazily whenever new logs have arrived since the last search."""
+        if not self._search_buffer_valid:
+            # Take a snapshot of the logs deque; emit() appends to it from
+            # producer threads and deques raise RuntimeError if mutated
+            # while iterating. One pass over the snapshot keeps the offsets
+            # consistent with the joined buffer.
+            logs = tuple(self.logs)
+            offsets = array.array('q')
+            parts = []
+            position = 0
+            for log in logs:
+                offsets.append(position)
+                text = log.ansi_stripped_log
+                parts.append(text)
+                # Add 1 for the separating newline.
+                position += len(text) + 1
+            self._search_buffer = '\n'.join(parts)
+            self._search_buffer_offsets = offsets
+            self._search_buffer_valid = True
+        return self._search_buffer, self._search_buffer_offsets
+
     def _update_log_prefix_width(self, record: logging.LogRecord):
         """Save the formatted prefix width if this is a new logger channel
         name."""
@@ -227,6 +264,9 @@ class LogStore(logging.Handler):
         # Check for bigger column widths.
         self.table.update_metadata_column_widths(self.logs[-1])
 
+        # The joined search buffer no longer reflects the stored logs.
+        self._search_buffer_valid = False
+
         # Update estimated byte_size.
         self.byte_size += sys.getsizeof(self.logs[-1])
         # If the total log lines is > max_history_size, delete the oldest line.
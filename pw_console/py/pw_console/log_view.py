@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 import asyncio
+import bisect
 import collections
 import copy
 from enum import Enum
@@ -131,7 +132,10 @@ class LogView:
         # Max frequency in seconds of prompt_toolkit UI redraws triggered by new
         # log lines.
         self._ui_update_frequency = 0.05
-        self._last_ui_update_time = time.time()
+        self._last_ui_update_time = time.monotonic()
+        # Handle for a single scheduled redraw covering a burst of logs that
+        # arrived before the update frequency elapsed.
+        self._pending_redraw_handle: Optional[asyncio.TimerHandle] = None
         self._last_log_store_index = 0
         self._new_logs_since_last_render = True
 
@@ -182,28 +186,96 @@ class LogView:
         new_index = (index + 1) % len(matchers)
         self.search_matcher = matchers[new_index]
 
+    def _search_buffer_usable(self) -> bool:
+        """Check if searches can scan the LogStore's joined buffer.
+
+        A single scan over the joined buffer only gives the same results
+        as per-line matching when no filtering or scrollback hiding is
+        active and the search applies to the whole log line. Only plain
+        substring (STRING matcher) searches qualify: regex patterns with
+        anchors or lookarounds referencing line boundaries can miss
+        per-line matches in a multi-line string, and a missed match has
+        no per-line fallback."""
+        if self.filtering_on or self.hidden_line_count() > 0:
+            return False
+        assert self.search_filter is not None
+        if self.search_filter.invert or self.search_filter.field:
+            return False
+        return self.search_filter.literal is not None
+
+    def _jump_to_search_buffer_match(self,
+                                     starting_index: int,
+                                     backwards: bool = False) -> bool:
+        """Search all logs with one regex scan over the joined log buffer.
+
+        Returns True if this fast path handled the search; either the
+        cursor was moved to a verified match or no log matches at all.
+        Returns False if the caller should fall back to the per-line
+        scan."""
+        assert self.search_filter is not None
+        buffer, offsets = self.log_store.get_search_buffer()
+        total = len(offsets)
+        if total == 0:
+            return True
+
+        regex = self.search_filter.regex
+        match: Optional[re.Match] = None
+        if backwards:
+            # Find the last match at or before starting_index, wrapping
+            # around to the end of the buffer if there is none.
+            end_pos = (offsets[starting_index + 1]
+                       if starting_index + 1 < total else len(buffer))
+            for match in regex.finditer(buffer, 0, end_pos):
+                pass
+            if match is None:
+                for match in regex.finditer(buffer, end_pos):
+                    pass
+        else:
+            # Find the first match at or after starting_index, wrapping
+            # around to the beginning of the buffer if there is none.
+            start_pos = (offsets[starting_index]
+                         if starting_index < total else len(buffer) + 1)
+            match = regex.search(buffer, start_pos)
+            if match is None:
+                match = regex.search(buffer, 0, start_pos)
+
+        if match is None:
+            # No log matches anywhere; nothing else to do.
+            return True
+
+        matched_index = bisect.bisect_right(offsets, match.start()) - 1
+        # Double check against the per-line matcher in case the match spans
+        # the newline separator between two logs.
+        if not self.search_filter.matches(self.log_store.logs[matched_index]):
+            return False
+        self._set_match_position(matched_index)
+        return True
+
     def search_forwards(self):
         if not self.search_filter:
             return
         self.search_highlight = True
 
         log_beginning_index = self.hidden_line_count()
+        log_count = self.get_last_log_index() - log_beginning_index + 1
+        if log_count <= 0:
+            return
 
         starting_index = self.log_index + 1
-        if starting_index > self.get_last_log_index():
-            starting_index = log_beginning_index
+        if self._search_buffer_usable() and self._jump_to_search_buffer_match(
+                starting_index):
+            return
 
         _, logs = self._get_log_lines()
-
-        # From current position +1 and down
-        for i in range(starting_index, self.get_last_log_index() + 1):
-            if self.search_filter.matches(logs[i]):
-                self._set_match_position(i)
-                return
-
-        # From the beginning to the original start
-        for i in range(log_beginning_index, starting_index):
-            if self.search_filter.matches(logs[i]):
+        # Hoist attribute lookups out of the loop below.
+        matches = self.search_filter.matches
+
+        # Loop over every log once starting at the line after the current
+        # position, wrapping around to the beginning if the end is reached.
+        for offset in range(log_count):
+            i = log_beginning_index + (
+                (starting_index - log_beginning_index + offset) % log_count)
+            if matches(logs[i]):
                 self._set_match_position(i)
                 return
 
@@ -213,22 +285,25 @@ class LogView:
         self.search_highlight = True
 
         log_beginning_index = self.hidden_line_count()
+        log_count = self.get_last_log_index() - log_beginning_index + 1
+        if log_count <= 0:
+            return
 
         starting_index = self.log_index - 1
-        if starting_index < 0:
-            starting_index = self.get_last_log_index()
+        if self._search_buffer_usable() and self._jump_to_search_buffer_match(
+                starting_index, backwards=True):
+            return
 
         _, logs = self._get_log_lines()
-
-        # From current position - 1 and up
-        for i in range(starting_index, log_beginning_index - 1, -1):
-            if self.search_filter.matches(logs[i]):
-                self._set_match_position(i)
-                return
-
-        # From the end to the original start
-        for i in range(self.get_last_log_index(), starting_index, -1):
-            if self.search_filter.matches(logs[i]):
+        # Hoist attribute lookups out of the loop below.
+        matches = self.search_filter.matches
+
+        # Loop over every log once starting at the line before the current
+        # position, wrapping around to the end if the beginning is reached.
+        for offset in range(log_count):
+            i = log_beginning_index + (
+                (starting_index - log_beginning_index - offset) % log_count)
+            if matches(logs[i]):
                 self._set_match_position(i)
                 return
 
@@ -243,6 +318,14 @@ class LogView:
         regex_text, regex_flags = preprocess_search_regex(
             text, matcher=search_matcher)
 
+        # String matching escapes the input text; the search is a plain
+        # substring scan. Save the needle so LogFilter.matches() can skip the
+        # regex engine entirely.
+        literal_text: Optional[str] = None
+        if search_matcher == SearchMatcher.STRING:
+            literal_text = (text.lower()
+                            if regex_flags & re.IGNORECASE else text)
+
         try:
             compiled_regex = re.compile(regex_text, regex_flags)
             self.search_filter = LogFilter(
@@ -250,6 +333,7 @@ class LogView:
                 input_text=text,
                 invert=invert,
                 field=field,
+                literal=literal_text,
             )
             _LOG.debug(self.search_filter)
         except re.error as error:
@@ -407,11 +491,13 @@ class LogView:
 
         starting_index = self.get_last_log_index()
         ending_index, logs = self._get_log_lines()
+        # Hoist attribute lookups out of the loop below.
+        matches = self.search_filter.matches
 
         # From the end of the log store to the beginning.
         for i in range(starting_index, ending_index - 1, -1):
             # Is this log a match?
-            if self.search_filter.matches(logs[i]):
+            if matches(logs[i]):
                 self.save_search_matched_line(i)
             # Pause every 100 lines or so
             if i % 100 == 0:
@@ -422,12 +508,17 @@ class LogView:
         starting_index = self.log_store.get_last_log_index()
         ending_index = -1
 
+        # Hoist attribute lookups out of the loop below.
+        logs = self.log_store.logs
+        filter_scan = self.filter_scan
+        appendleft = self.filtered_logs.appendleft
+
         # From the end of the log store to the beginning.
         for i in range(starting_index, ending_index, -1):
             # Is this log a match?
-            if self.filter_scan(self.log_store.logs[i]):
+            if filter_scan(logs[i]):
                 # Add to the beginning of the deque.
-                self.filtered_logs.appendleft(self.log_store.logs[i])
+                appendleft(logs[i])
             # TODO(tonymd): Tune these values.
             # Pause every 100 lines or so
             if i % 100 == 0:
@@ -511,17 +602,35 @@ class LogView:
         """
         latest_total = self.log_store.get_total_count()
 
+        if not self.filtering_on and not self.search_filter:
+            # Fast path for the common live streaming case: no filters or
+            # searches are active so no per-log scanning is needed, only
+            # counter and flag updates before the redraw-rate check. This
+            # runs once per incoming log line.
+            self._last_log_store_index = latest_total
+            self._new_logs_since_last_render = True
+            if self.follow:
+                # Set the follow event flag for the next render_content call.
+                self.follow_event = FollowEvent.STICKY_FOLLOW
+            self._update_prompt_toolkit_ui()
+            return
+
+        logs = self.log_store.logs
+
         if self.filtering_on:
             # Scan newly arived log lines
+            filter_scan = self.filter_scan
+            append = self.filtered_logs.append
             for i in range(self._last_log_store_index, latest_total):
-                if self.filter_scan(self.log_store.logs[i]):
-                    self.filtered_logs.append(self.log_store.logs[i])
+                if filter_scan(logs[i]):
+                    append(logs[i])
 
         if self.search_filter:
             last_matched_log: Optional[int] = None
             # Scan newly arived log lines
+            matches = self.search_filter.matches
             for i in range(self._last_log_store_index, latest_total):
-                if self.search_filter.matches(self.log_store.logs[i]):
+                if matches(logs[i]):
                     self.save_search_matched_line(i)
                     last_matched_log = i
             if last_matched_log and self.follow_search_match:
@@ -541,7 +650,7 @@ class LogView:
 
     def _update_prompt_toolkit_ui(self):
         """Update Prompt Toolkit UI if a certain amount of time has passed."""
-        emit_time = time.time()
+        emit_time = time.monotonic()
         # Has enough time passed since last UI redraw?
         if emit_time > self._last_ui_update_time + self._ui_update_frequency:
             # Update last log time
@@ -549,9 +658,36 @@ class LogView:
 
             # Trigger Prompt Toolkit UI redraw.
             self.log_pane.application.redraw_ui()
+            return
+
+        # Not enough time has passed; coalesce this and any further calls
+        # into a single deferred redraw so trailing logs in a burst still
+        # appear on screen.
+        if self._pending_redraw_handle is not None:
+            return
+        try:
+            event_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running event loop in this thread; skip scheduling. The
+            # next log arrival after the update frequency elapses will
+            # trigger a redraw as before.
+            return
+        delay = (self._last_ui_update_time + self._ui_update_frequency -
+                 emit_time)
+        self._pending_redraw_handle = event_loop.call_later(
+            delay, self._deferred_redraw)
+
+    def _deferred_redraw(self):
+        """Run a redraw scheduled by _update_prompt_toolkit_ui()."""
+        self._pending_redraw_handle = None
+        self._last_ui_update_time = time.monotonic()
+        self.log_pane.application.redraw_ui()
 
     def get_cursor_position(self) -> Point:
-        """Return the position of the cursor."""
+        """Return the position of the cursor.
+
+        The cursor row is stored directly by LogScreen when lines are
+        rendered; no scan over rendered fragments is required."""
         return Point(0, self.log_screen.cursor_position)
 
     def scroll_to_top(self):
@@ -792,8 +928,13 @@ class LogView:
 
             screen_update_needed = True
 
-        if self.follow:
-            # Select the last line for follow mode.
+        if self.follow and (screen_update_needed
+                            or self.log_screen.cursor_position !=
+                            self.log_screen.height - 1):
+            # Select the last line for follow mode. If the cursor is already
+            # on the last line and nothing else changed this is a redraw
+            # triggered by an unrelated prompt_toolkit event; reuse the
+            # cached line fragments instead of rebuilding every line.
             self.log_screen.move_cursor_to_bottom()
             screen_update_needed = True
 
@@ -831,14 +972,14 @@ class LogView:
             log_index_range = range(self.marked_logs_start,
                                     self.marked_logs_end + 1)
 
-        text_output = ''
+        text_lines = []
         for i in log_index_range:
             log_text = formatter(log_source[i])
-            text_output += log_text
+            text_lines.append(log_text)
             if not log_text.endswith('\n'):
-                text_output += '\n'
+                text_lines.append('\n')
 
-        return text_output
+        return ''.join(text_lines)
 
     def export_logs(
         self,
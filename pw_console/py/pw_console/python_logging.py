@@ -15,6 +15,8 @@
 
 import copy
 import logging
+import logging.handlers
+import queue
 import tempfile
 from datetime import datetime
 from typing import Iterable, Iterator, Optional
@@ -53,6 +55,59 @@ def create_temp_log_file(prefix: Optional[str] = None,
     return log_file_name
 
 
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that blocks the producer when the queue is full.
+
+    The base QueueHandler uses put_nowait() which raises queue.Full on a
+    bounded queue. Blocking instead applies back-pressure to runaway log
+    producers rather than dropping records."""
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+
+def setup_queued_log_handling(
+        logger: logging.Logger,
+        *handlers: logging.Handler,
+        queue_max_size: int = 4096) -> logging.handlers.QueueListener:
+    """Route a logger's records to handlers through a background queue.
+
+    The returned QueueListener runs a thread that pulls records off the
+    queue and passes them to the given handlers. Emitting threads only
+    enqueue the raw record; formatting, storage and console UI notification
+    all happen on the listener thread. Use this when high rate log
+    producers (for example device output readers) should never block on
+    console log processing.
+
+    The queue is bounded by queue_max_size. If handlers fall behind by
+    more than that many records, producers block until space is available
+    instead of growing the queue without limit.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import logging
+
+        from pw_console import LogStore
+        from pw_console.python_logging import setup_queued_log_handling
+
+        device_log_store = LogStore()
+        listener = setup_queued_log_handling(
+            logging.getLogger('usb_gadget'), device_log_store)
+
+        # At shutdown, flush pending records and stop the thread.
+        listener.stop()
+    """
+    record_queue: queue.Queue = queue.Queue(maxsize=queue_max_size)
+    queue_handler = _BlockingQueueHandler(record_queue)
+    listener = logging.handlers.QueueListener(record_queue,
+                                              *handlers,
+                                              respect_handler_level=True)
+    logger.addHandler(queue_handler)
+    listener.start()
+    return listener
+
+
 def set_logging_last_resort_file_handler(
         file_name: Optional[str] = None) -> None:
     log_file = file_name if file_name else create_temp_log_file()
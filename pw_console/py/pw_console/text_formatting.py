@@ -145,13 +145,13 @@ def join_adjacent_style_tuples(
     return new_fragments
 
 
-def fill_character_width(input_fragments: StyleAndTextTuples,
-                         fragment_width: int,
-                         window_width: int,
-                         line_wrapping: bool = False,
-                         remaining_width: int = 0,
-                         horizontal_scroll_amount: int = 0,
-                         add_cursor: bool = False) -> StyleAndTextTuples:
+def fill_character_width(
+        input_fragments: StyleAndTextTuples,
+        fragment_width: int,
+        window_width: int,
+        line_wrapping: bool = False,
+        remaining_width: int = 0,
+        horizontal_scroll_amount: int = 0) -> StyleAndTextTuples:
     """Fill line to the width of the window using spaces."""
     # Calculate the number of spaces to add at the end.
     empty_characters = window_width - fragment_width
@@ -184,13 +184,6 @@ def fill_character_width(input_fragments: StyleAndTextTuples,
         # Restore the \n
         line_fragments.append(('', '\n'))
 
-    if add_cursor:
-        # Add a cursor to this line by adding SetCursorPosition fragment.
-        line_fragments_remainder = line_fragments
-        line_fragments = [('[SetCursorPosition]', '')]
-        # Use extend to keep types happy.
-        line_fragments.extend(line_fragments_remainder)
-
     return line_fragments
 
 
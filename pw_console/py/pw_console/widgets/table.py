@@ -33,6 +33,9 @@ class TableView:
     LAST_TABLE_COLUMN_NAMES = ['msg', 'message']
 
     def __init__(self, prefs: ConsolePrefs):
+        # Generation counter bumped whenever column widths or prefs change.
+        # Cached formatted rows tagged with an older generation are stale.
+        self._formatting_generation = 0
         self.set_prefs(prefs)
         self.column_widths: collections.OrderedDict = collections.OrderedDict()
         self._header_fragment_cache = None
@@ -50,6 +53,7 @@ class TableView:
         self.prefs = prefs
         # Max column widths of each log field
         self.column_padding = ' ' * self.prefs.spaces_between_columns
+        self._formatting_generation += 1
 
     def all_column_names(self):
         columns_names = [
@@ -96,6 +100,7 @@ class TableView:
 
     def update_metadata_column_widths(self, log: LogLine):
         """Calculate the max widths for each metadata field."""
+        widths_changed = False
         for field_name, value in log.metadata.fields.items():
             value_string = str(value)
 
@@ -108,12 +113,18 @@ class TableView:
             current_width = self.column_widths.get(field_name, 0)
             if len(value_string) > current_width:
                 self.column_widths[field_name] = len(value_string)
+                widths_changed = True
 
         # Update log level character width.
         ansi_stripped_level = pw_console.text_formatting.strip_ansi(
             log.record.levelname)
         if len(ansi_stripped_level) > self.column_widths['level']:
             self.column_widths['level'] = len(ansi_stripped_level)
+            widths_changed = True
+
+        if widths_changed:
+            # Existing cached formatted rows use outdated justification.
+            self._formatting_generation += 1
 
         self.column_width_prefix_total = self._width_of_justified_fields()
         self._update_table_header()
@@ -144,9 +155,31 @@ class TableView:
         """Get pre-formatted table header."""
         return self._header_fragment_cache
 
+    def _row_formatting_tag(self) -> tuple:
+        """Identify the settings a cached formatted row depends on.
+
+        The menu checkboxes toggle these prefs on the shared ConsolePrefs
+        instance in place without calling set_prefs(), so their values are
+        included here directly rather than relying on the generation counter
+        alone. Cached rows rendered under a different tag are stale."""
+        return (
+            self._formatting_generation,
+            self.prefs.hide_date_from_log_time,
+            self.prefs.show_python_file,
+            self.prefs.show_python_logger,
+            self.prefs.show_source_file,
+        )
+
     def formatted_row(self, log: LogLine) -> StyleAndTextTuples:
         """Render a single table row."""
         # pylint: disable=too-many-locals
+        # Log lines are immutable once stored; reuse the cached row unless
+        # column widths or prefs changed since it was rendered.
+        formatting_tag = self._row_formatting_tag()
+        if (log.table_row_cache is not None
+                and log.table_row_cache[0] == formatting_tag):
+            return log.table_row_cache[1]
+
         padding_formatted_text = ('', self.column_padding)
         # Don't apply any background styling that would override the parent
         # window or selected-log-line style.
@@ -257,4 +290,5 @@ class TableView:
 
         # Add the final new line for this row.
         table_fragments.append(('', '\n'))
+        log.table_row_cache = (formatting_tag, table_fragments)
         return table_fragments
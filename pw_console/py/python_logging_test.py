@@ -0,0 +1,61 @@
+# Copyright 2022 The Pigweed Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Tests for pw_console.python_logging"""
+
+import logging
+import logging.handlers
+import unittest
+
+from pw_console.console_prefs import ConsolePrefs
+from pw_console.log_store import LogStore
+from pw_console.python_logging import setup_queued_log_handling
+
+
+class TestSetupQueuedLogHandling(unittest.TestCase):
+    """Tests for queued log handling."""
+    def test_records_reach_handlers_through_bounded_queue(self) -> None:
+        """Test producers log through a bounded queue to the handlers."""
+        log_store = LogStore(prefs=ConsolePrefs(
+            project_file=False, project_user_file=False, user_file=False))
+        test_log = logging.getLogger('python_logging.test_queued')
+        test_log.setLevel(logging.DEBUG)
+        test_log.propagate = False
+
+        listener = setup_queued_log_handling(test_log,
+                                             log_store,
+                                             queue_max_size=8)
+        try:
+            # The producer logger should only have the queue handler.
+            self.assertEqual(1, len(test_log.handlers))
+            self.assertIsInstance(test_log.handlers[0],
+                                  logging.handlers.QueueHandler)
+            # The queue should be bounded to apply back-pressure.
+            self.assertEqual(8, listener.queue.maxsize)
+
+            # Log more records than the queue can hold; producers should
+            # block until the listener drains the queue, not drop records.
+            for i in range(20):
+                test_log.debug('Queued log %s', i)
+        finally:
+            # Flush remaining records and stop the listener thread.
+            listener.stop()
+            test_log.removeHandler(test_log.handlers[0])
+
+        self.assertEqual(20, log_store.get_total_count())
+        self.assertEqual('Queued log 0', log_store.logs[0].record.message)
+        self.assertEqual('Queued log 19', log_store.logs[-1].record.message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -241,6 +241,29 @@ class TestTableView(unittest.TestCase):
             table.update_metadata_column_widths(log)
             self.assertEqual(formatted_log, table.formatted_row(log))
 
+    def test_cached_rows_not_reused_after_pref_toggle(self) -> None:
+        """Test in-place pref toggles invalidate cached formatted rows.
+
+        The menu checkboxes mutate the shared ConsolePrefs instance without
+        calling TableView.set_prefs()."""
+        table = TableView(self.prefs)
+        log = make_log()
+        table.update_metadata_column_widths(log)
+
+        row_with_date = table.formatted_row(log)
+        self.assertIn(_TIMESTAMP_SAMPLE_STRING,
+                      [fragment[1].strip() for fragment in row_with_date])
+        # The second call should return the cached row.
+        self.assertIs(row_with_date, table.formatted_row(log))
+
+        self.prefs.toggle_bool_option('hide_date_from_log_time')
+        row_without_date = table.formatted_row(log)
+        self.assertIsNot(row_with_date, row_without_date)
+        # The date portion of the timestamp should no longer appear.
+        row_text = [fragment[1].strip() for fragment in row_without_date]
+        self.assertNotIn(_TIMESTAMP_SAMPLE_STRING, row_text)
+        self.assertIn(_TIMESTAMP_SAMPLE_STRING.split()[1], row_text)
+
 
 if __name__ == '__main__':
     unittest.main()